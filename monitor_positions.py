@@ -21,7 +21,7 @@ from src.data.cache import DataCache
 from src.data.exchange import ExchangeClient
 from src.features.spread import SpreadCalculator
 from src.features.cointegration import CointegrationTester
-from src.runtime.notify import NotificationManager
+from src.runtime.notify import get_notifier
 
 
 class Position:
@@ -80,7 +80,7 @@ class PositionMonitor:
         self.cache = DataCache()
         self.exchange = None if use_cache_only else ExchangeClient()
         self.coint_tester = CointegrationTester()
-        self.notifier = NotificationManager(self.config)
+        self.notifier = get_notifier(self.config)
 
     def load_positions(self) -> List[Position]:
         """Load open positions from file."""
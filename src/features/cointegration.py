@@ -2,7 +2,7 @@
 
 import numpy as np
 import pandas as pd
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, Union
 from statsmodels.tsa.stattools import adfuller, coint
 from statsmodels.regression.linear_model import OLS
 import warnings
@@ -35,8 +35,8 @@ class CointegrationTester:
 
     def test_cointegration(
         self,
-        price1: pd.Series,
-        price2: pd.Series
+        price1: Union[pd.Series, np.ndarray],
+        price2: Union[pd.Series, np.ndarray]
     ) -> Dict[str, Any]:
         """
         Comprehensive cointegration test between two price series.
@@ -48,8 +48,8 @@ class CointegrationTester:
         4. Hurst exponent (mean reversion strength)
 
         Args:
-            price1: First asset prices
-            price2: Second asset prices
+            price1: First asset prices (Series or array)
+            price2: Second asset prices (Series or array)
 
         Returns:
             Dictionary with test results and statistics
@@ -65,8 +65,8 @@ class CointegrationTester:
             }
 
         # Use recent data for testing
-        p1 = price1.iloc[-self.lookback_window:].values
-        p2 = price2.iloc[-self.lookback_window:].values
+        p1 = np.asarray(price1, dtype=np.float64)[-self.lookback_window:]
+        p2 = np.asarray(price2, dtype=np.float64)[-self.lookback_window:]
 
         # Remove any NaN values
         mask = ~(np.isnan(p1) | np.isnan(p2))
@@ -190,9 +190,17 @@ class CointegrationTester:
             lags = range(2, min(100, len(series) // 2))
             tau = [np.std(np.subtract(series[lag:], series[:-lag])) for lag in lags]
 
-            # Fit power law
-            reg = np.polyfit(np.log(lags), np.log(tau), 1)
-            hurst = reg[0]
+            # Fit power law (closed-form OLS slope; avoids polyfit's lstsq/SVD path)
+            log_lags = np.log(np.asarray(lags, dtype=np.float64))
+            log_tau = np.log(np.asarray(tau, dtype=np.float64))
+            n = log_lags.size
+            if n < 2:
+                return None
+            sum_x = log_lags.sum()
+            sum_y = log_tau.sum()
+            sum_xx = (log_lags * log_lags).sum()
+            sum_xy = (log_lags * log_tau).sum()
+            hurst = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x * sum_x)
 
             return hurst
 
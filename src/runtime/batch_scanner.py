@@ -9,6 +9,7 @@ Flags largely mirror Scanner, but operate across all enabled pairs in config.yam
 
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import List
@@ -26,7 +27,8 @@ from src.features.cointegration import CointegrationTester
 from src.strategy.state import TradingStateMachine, SignalType
 from src.strategy.sizing import VolatilityTargetingSizer
 from src.runtime.tickets import TradeTicketGenerator
-from src.runtime.notify import NotificationManager
+from src.runtime.notify import NotificationManager, get_notifier
+from src.runtime.dedup import is_duplicate, load_last_signals, save_last_signals, signal_key
 from src.utils.logging import setup_logging
 
 
@@ -34,6 +36,21 @@ def safe_name(name: str) -> str:
     return "".join(c.lower() if c.isalnum() else "_" for c in name)
 
 
+def notify_ticket(notifier: NotificationManager, ticket: str, throttle_sec: float) -> None:
+    """Send one ticket to each configured channel, throttling to respect webhook limits."""
+    sent_any = False
+    if notifier.slack_enabled and notifier.slack_webhook:
+        sent_any = notifier._send_slack(ticket) or sent_any
+        time.sleep(throttle_sec)
+    if notifier.discord_webhook:
+        # Rate limits (429 + Retry-After) are retried by the notifier's session
+        notifier._send_discord(ticket)
+        time.sleep(throttle_sec)
+    if not sent_any and not notifier.discord_webhook:
+        # Fallback to console if no channels configured
+        print(ticket)
+
+
 def run_batch(
     config_path: str,
     dry_run: bool = False,
@@ -53,6 +70,9 @@ def run_batch(
     exchange_name = config.get("exchange", "binance")
     timeframe = config.get("timeframe", "1h")
     z_in = config.get("thresholds.z_in", 2.0)
+    z_out = config.get("thresholds.z_out", 0.5)
+    z_stop = config.get("thresholds.z_stop", 3.5)
+    min_adv = config.get("filters.min_adv_usd", 5_000_000)
 
     # Initialize cointegration tester
     coint_tester = CointegrationTester(
@@ -62,7 +82,7 @@ def run_batch(
         lookback_window=config.get('cointegration_lookback', 500)
     )
 
-    notifier = NotificationManager(config)
+    notifier = get_notifier(config)
 
     # If only testing Discord webhook, send and exit (no market access required)
     if test_discord:
@@ -81,15 +101,25 @@ def run_batch(
         slippage_bps=config.get("costs.slippage_bps", 5)
     )
     ticket_gen = TradeTicketGenerator()
-    run_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    logger.info(f"Starting batch scanner run: {run_id}")
+    # Capture the run clock once; ticket filenames reuse it instead of re-reading the time
+    now_utc = datetime.now(timezone.utc)
+    run_id = now_utc.strftime("%Y%m%d_%H%M%S")
+    ticket_ts = now_utc.strftime("%Y%m%d_%H%M%S_%f")
+    logger.info("Starting batch scanner run: %s", run_id)
 
     tickets: List[str] = []
     # Per-message throttle seconds (Discord typical limits are strict; be conservative)
     throttle_sec = float(config.get("notifications.throttle_seconds", 0.75) or 0.75)
 
+    # Single worker keeps tickets ordered and the per-message throttle meaningful
+    notify_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ticket-notify")
+    notify_futures = []
+
     pairs = [p for p in (config.get("pairs", []) or []) if p.get("enabled", True)]
 
+    last_signals = load_last_signals()
+    last_signals_changed = False
+
     # Optimize: update cache once per unique symbol
     symbols = set()
     for p in pairs:
@@ -114,8 +144,9 @@ def run_batch(
                                      lookback_bars=effective_bars)
         data_map = updated
 
-        # Ensure cache has enough history; backfill if too short for any symbol
-        for sym in symbols:
+        # Ensure cache has enough history; backfill if too short for any symbol.
+        # Serial on the one exchange client so its rate limiter covers every request.
+        for sym in sorted(symbols):
             df = data_map.get(sym, pd.DataFrame())
             if df is None or df.empty or len(df) < effective_bars:
                 try:
@@ -124,9 +155,19 @@ def run_batch(
                     if hist is not None and not hist.empty:
                         cache.save_ohlcv(hist, exchange_name, sym, timeframe, append=True)
                         data_map[sym] = cache.load_ohlcv(exchange_name, sym, timeframe)
-                        logger.info(f"Backfilled {sym} to {len(data_map[sym])} bars")
+                        logger.info("Backfilled %s to %d bars", sym, len(data_map[sym]))
                 except Exception as e:
-                    logger.warning(f"Backfill failed for {sym}: {e}")
+                    logger.warning("Backfill failed for %s: %s", sym, e)
+
+    # Compute ADV once per unique symbol rather than once per pair leg
+    adv_map = {}
+    for sym, df in data_map.items():
+        if df is None or df.empty:
+            continue
+        try:
+            adv_map[sym] = float(cache.calculate_liquidity_metrics(df)['adv_usd'].iat[-1])
+        except Exception as e:
+            logger.warning("Liquidity metrics failed for %s: %s", sym, e)
 
     for pair in pairs:
         name = pair["name"]
@@ -140,7 +181,7 @@ def run_batch(
             x_df = data_map.get(x_symbol, pd.DataFrame())
 
             if y_df.empty or x_df.empty:
-                logger.warning(f"No data for {name}")
+                logger.warning("No data for %s", name)
                 continue
 
             # Test cointegration before proceeding
@@ -151,78 +192,84 @@ def run_batch(
                 )
 
                 if not coint_result['is_cointegrated']:
-                    logger.info(f"{name}: Not cointegrated - {coint_result.get('reason', 'Unknown')}")
+                    logger.info("%s: Not cointegrated - %s", name, coint_result.get('reason', 'Unknown'))
                     continue
 
-                logger.info(f"{name}: Cointegrated ✅ (p={coint_result.get('adf_pvalue', 1.0):.3f}, "
-                          f"half_life={coint_result.get('half_life', 0):.1f})")
+                logger.info("%s: Cointegrated ✅ (p=%.3f, half_life=%.1f)", name,
+                            coint_result.get('adf_pvalue', 1.0), coint_result.get('half_life', 0))
 
             # Signals
             signals = SpreadCalculator.calculate_all_signals(
                 btc_prices=x_df['close'],  # X
                 eth_prices=y_df['close'],  # Y
-                beta_window=config.get("windows.ols_beta", 200),
-                zscore_window=config.get("windows.zscore", 100)
+                beta_window=beta_w,
+                zscore_window=z_w
             )
 
-            latest = signals.iloc[-1]
+            # Direct scalar access for the latest bar (avoids building a row Series)
+            latest_z = signals['zscore'].iat[-1]
+            latest_beta = signals['beta'].iat[-1]
+            latest_spread = signals['spread'].iat[-1]
+            latest_spread_std = signals['spread_std'].iat[-1]
+            latest_x_price = signals['btc_price'].iat[-1]
+            latest_y_price = signals['eth_price'].iat[-1]
 
             # Liquidity/ADV check
-            y_liq = cache.calculate_liquidity_metrics(y_df)
-            x_liq = cache.calculate_liquidity_metrics(x_df)
-            y_adv = y_liq['adv_usd'].iloc[-1]
-            x_adv = x_liq['adv_usd'].iloc[-1]
-            min_adv = config.get("filters.min_adv_usd", 5_000_000)
+            y_adv = adv_map.get(y_symbol, 0.0)
+            x_adv = adv_map.get(x_symbol, 0.0)
             if not ignore_adv and (y_adv < min_adv or x_adv < min_adv):
-                logger.info(f"{name}: ADV filter not met (Y={y_adv:.0f}, X={x_adv:.0f})")
+                logger.info("%s: ADV filter not met (Y=%.0f, X=%.0f)", name, y_adv, x_adv)
                 continue
 
             # State machine per pair
             sm = TradingStateMachine(
-                z_in=config.get("thresholds.z_in", 2.0),
-                z_out=config.get("thresholds.z_out", 0.5),
-                z_stop=config.get("thresholds.z_stop", 3.5),
+                z_in=z_in,
+                z_out=z_out,
+                z_stop=z_stop,
                 state_file=pair_state_file
             )
             if sm.previous_zscore is None and len(signals) >= 2:
-                prev = signals['zscore'].iloc[-2]
+                prev = signals['zscore'].iat[-2]
                 if pd.notna(prev):
                     sm.previous_zscore = float(prev)
 
             signal = sm.process_tick(
                 timestamp=signals.index[-1],
-                zscore=latest['zscore'],
-                beta=latest['beta'],
-                spread=latest['spread'],
-                btc_price=latest['btc_price'],
-                eth_price=latest['eth_price']
+                zscore=latest_z,
+                beta=latest_beta,
+                spread=latest_spread,
+                btc_price=latest_x_price,
+                eth_price=latest_y_price
             )
 
             # Optional level trigger
             if (signal.signal_type == SignalType.NO_ACTION and level_trigger and
-                sm.current_state == sm.current_state.NEUTRAL and pd.notna(latest['zscore'])):
-                if abs(latest['zscore']) >= z_in:
-                    stype = SignalType.ENTER_SHORT_SPREAD if latest['zscore'] > 0 else SignalType.ENTER_LONG_SPREAD
+                sm.current_state == sm.current_state.NEUTRAL and pd.notna(latest_z)):
+                if abs(latest_z) >= z_in:
+                    stype = SignalType.ENTER_SHORT_SPREAD if latest_z > 0 else SignalType.ENTER_LONG_SPREAD
                     from src.strategy.state import TradingSignal, PositionState
                     new_state = PositionState.SHORT_SPREAD if stype == SignalType.ENTER_SHORT_SPREAD else PositionState.LONG_SPREAD
                     signal = TradingSignal(
                         timestamp=signals.index[-1],
                         signal_type=stype,
-                        zscore=float(latest['zscore']),
-                        beta=float(latest['beta']),
-                        spread=float(latest['spread']),
+                        zscore=float(latest_z),
+                        beta=float(latest_beta),
+                        spread=float(latest_spread),
                         reason=f"Level trigger |z| >= {z_in}",
-                        btc_price=float(latest['btc_price']),
-                        eth_price=float(latest['eth_price']),
+                        btc_price=float(latest_x_price),
+                        eth_price=float(latest_y_price),
                         previous_state=sm.current_state,
                         new_state=new_state
                     )
 
-            if signal.signal_type != SignalType.NO_ACTION:
+            if signal.signal_type != SignalType.NO_ACTION and is_duplicate(last_signals, name, signal):
+                # Same signal for the same bar was already ticketed (e.g. re-run within the hour)
+                logger.info("%s: duplicate %s signal, skipping ticket", name, signal.signal_type.value)
+            elif signal.signal_type != SignalType.NO_ACTION:
                 # Size
                 pos = sizer.calculate_position_size(
                     beta=signal.beta,
-                    spread_std=float(latest.get('spread_std', 0) or 0),
+                    spread_std=float(latest_spread_std or 0),
                     btc_price=signal.btc_price,
                     eth_price=signal.eth_price,
                     btc_adv_usd=x_adv,
@@ -232,35 +279,40 @@ def run_batch(
                 ticket = ticket_gen.generate_ticket(
                     signal, pos, y_symbol=y_symbol, x_symbol=x_symbol, funding_info={}
                 )
-                ticket_file = ticket_gen.save_ticket(ticket, run_id, pair_slug=safe_name(name))
-                logger.info(f"{name}: ticket saved -> {ticket_file}")
+                ticket_file = ticket_gen.save_ticket(
+                    ticket, run_id, pair_slug=safe_name(name), timestamp=ticket_ts
+                )
+                logger.info("%s: ticket saved -> %s", name, ticket_file)
+                # Only dedupe signals whose ticket was actually written
+                last_signals[name] = signal_key(signal)
+                last_signals_changed = True
                 tickets.append(f"{name}\n{ticket}")
 
-                # Send one message per ticket with simple throttling to respect webhook limits
+                # Send in the background so remaining pairs are scanned while webhooks post
                 if not dry_run:
-                    sent_any = False
-                    if notifier.slack_enabled and notifier.slack_webhook:
-                        sent_any = notifier._send_slack(ticket) or sent_any
-                        time.sleep(throttle_sec)
-                    if notifier.discord_webhook:
-                        # Attempt send; if it fails due to rate limit, do a simple backoff
-                        ok = notifier._send_discord(ticket)
-                        if not ok:
-                            time.sleep(max(throttle_sec * 2, 2.0))
-                            notifier._send_discord(ticket)
-                        time.sleep(throttle_sec)
-                    if not sent_any and not notifier.discord_webhook:
-                        # Fallback to console if no channels configured
-                        print(ticket)
+                    notify_futures.append(
+                        (name, notify_pool.submit(notify_ticket, notifier, ticket, throttle_sec))
+                    )
             else:
-                logger.info(f"{name}: no signal")
+                logger.info("%s: no signal", name)
 
         except Exception as e:
-            logger.error(f"{name}: error {e}")
+            logger.error("%s: error %s", name, e)
             continue
 
     # Previously: aggregated summary. Now we send per ticket above.
 
+    # Wait for queued notifications so failures still surface in this run's log
+    for name, future in notify_futures:
+        try:
+            future.result()
+        except Exception as e:
+            logger.error("%s: notification error %s", name, e)
+    notify_pool.shutdown()
+
+    if last_signals_changed and not dry_run:
+        save_last_signals(last_signals)
+
     # Console summary
     print(f"Tickets this run: {len(tickets)}")
     if tickets:
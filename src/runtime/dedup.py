@@ -0,0 +1,40 @@
+"""Duplicate-ticket suppression for the batch scanner."""
+
+import json
+import os
+from pathlib import Path
+
+from src.strategy.state import TradingSignal
+
+# Last emitted signal per pair, used to suppress duplicate tickets for the same bar
+LAST_SIGNALS_FILE = Path("data/last_signals.json")
+
+
+def signal_key(signal: TradingSignal) -> str:
+    """Identify a signal by type, bar timestamp and z-score bucket for de-duplication."""
+    return f"{signal.signal_type.value}|{signal.timestamp.isoformat()}|{float(signal.zscore):.2f}"
+
+
+def is_duplicate(last_signals: dict, name: str, signal: TradingSignal) -> bool:
+    """Check whether this pair already emitted the same signal on the same bar."""
+    return last_signals.get(name) == signal_key(signal)
+
+
+def load_last_signals(path: Path = LAST_SIGNALS_FILE) -> dict:
+    """Load the last emitted signal key per pair (empty if missing or unreadable)."""
+    try:
+        with open(path, 'r') as f:
+            last_signals = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return last_signals if isinstance(last_signals, dict) else {}
+
+
+def save_last_signals(last_signals: dict, path: Path = LAST_SIGNALS_FILE) -> None:
+    """Persist the last emitted signal key per pair."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Atomic replace: a crash mid-write never leaves a truncated file
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(last_signals, f, indent=2)
+    os.replace(tmp_path, path)
@@ -1,14 +1,54 @@
 """Notification system for trade signals."""
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
 
 from src.strategy.state import TradingSignal, SignalType
 from src.strategy.sizing import PositionSize
 
+# Upper bound on any server-requested back-off (Retry-After or Telegram's retry_after)
+MAX_RETRY_AFTER_SEC = 30.0
+
+# Transient HTTP statuses retried by the session adapters
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Emoji and action label per signal type
+_SLACK_DISPATCH = {
+    SignalType.ENTER_LONG_SPREAD: ("📈", "LONG SPREAD"),
+    SignalType.ENTER_SHORT_SPREAD: ("📉", "SHORT SPREAD"),
+    SignalType.EXIT_POSITION: ("✅", "EXIT POSITION"),
+    SignalType.STOP_LOSS: ("🛑", "STOP LOSS"),
+}
+_SLACK_DEFAULT = ("ℹ️", "INFO")
+
+_MSG_TEMPLATE = (
+    "{emoji} *BTC-ETH Stat Arb Signal*\n"
+    "*Action:* {action}\n"
+    "*Z-score:* {zscore:.3f}\n"
+    "*Beta:* {beta:.3f}\n"
+    "\n"
+    "*Positions:*\n"
+    "• ETH: ${eth_notional:,.0f}\n"
+    "• BTC: ${btc_notional:,.0f}\n"
+    "\n"
+    "*Reason:* {reason}\n"
+    "*Time:* {timestamp:%Y-%m-%d %H:%M UTC}"
+)
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After but never waits longer than MAX_RETRY_AFTER_SEC."""
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        return min(super().parse_retry_after(retry_after), MAX_RETRY_AFTER_SEC)
+
 
 class NotificationManager:
     """Manage notifications to Slack, Telegram, etc."""
@@ -25,13 +65,65 @@ class NotificationManager:
         self.telegram_enabled = config.get("notifications.telegram_enabled", False)
         self.telegram_token = config.get("notifications.telegram_token")
         self.telegram_chat_id = config.get("notifications.telegram_chat_id")
+        self.telegram_url = (
+            f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
+            if self.telegram_token else None
+        )
         # Discord (optional)
         self.discord_webhook = config.get("notifications.discord_webhook")
 
         # Debounce settings
-        self.last_notification_time = None
+        # Monotonic seconds of the last successful send (immune to wall-clock jumps)
+        self.last_notification_time: Optional[float] = None
         self.debounce_minutes = config.get("notifications.debounce_minutes", 5)
 
+        # Shared HTTP session so webhook posts reuse keep-alive TCP/TLS connections
+        self.session = self._build_session()
+        # Worker threads for fanning a message out to all channels at once
+        self._fanout_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="notify")
+
+    @staticmethod
+    def _build_adapter(status_forcelist: Tuple[int, ...]) -> HTTPAdapter:
+        """Create a pooled adapter with exponential-backoff retries on the given statuses."""
+        retry_kwargs = {
+            "total": 3,
+            "backoff_factor": 0.5,
+            "status_forcelist": status_forcelist,
+            "allowed_methods": frozenset(["POST"]),
+            "respect_retry_after_header": True,
+            "raise_on_status": False,
+        }
+        try:
+            # Jitter spreads retries out when several webhooks fail together (urllib3 >= 2)
+            retry = _CappedRetry(backoff_jitter=0.25, **retry_kwargs)
+        except TypeError:
+            retry = _CappedRetry(**retry_kwargs)
+        return HTTPAdapter(pool_connections=4, pool_maxsize=100, max_retries=retry)
+
+    @classmethod
+    def _build_session(cls) -> requests.Session:
+        """Create a pooled HTTP session with one retry layer per channel."""
+        session = requests.Session()
+        session.mount("https://", cls._build_adapter(_RETRY_STATUSES))
+        # Telegram sends its 429 back-off in the body, which _send_telegram
+        # handles itself; the adapter only retries server errors there
+        session.mount(
+            "https://api.telegram.org/",
+            cls._build_adapter(tuple(s for s in _RETRY_STATUSES if s != 429))
+        )
+        return session
+
+    def close(self):
+        """Close the fan-out workers and the underlying HTTP session."""
+        self._fanout_pool.shutdown(wait=False)
+        self.session.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def send_trade_signal(
         self,
         signal: TradingSignal,
@@ -61,30 +153,54 @@ class NotificationManager:
         message = ticket_text or self._format_message(signal, position_size)
 
         # Send to enabled channels
-        success = True
+        senders = []
         if self.slack_enabled and self.slack_webhook:
-            success = success and self._send_slack(message)
+            senders.append(self._send_slack)
 
         if self.telegram_enabled and self.telegram_token and self.telegram_chat_id:
-            success = success and self._send_telegram(message)
+            senders.append(self._send_telegram)
 
         # Discord webhook
         if self.discord_webhook:
-            success = success and self._send_discord(message)
+            senders.append(self._send_discord)
+
+        success = self._send_all(senders, message)
 
         # Update last notification time
         if success:
-            self.last_notification_time = datetime.now(timezone.utc)
+            self.last_notification_time = time.monotonic()
 
         return success
 
+    def _send_all(self, senders: List[Callable[[str], bool]], message: str) -> bool:
+        """
+        Send a message through every sender concurrently.
+
+        Webhook posts are independent, so total latency is the slowest channel
+        rather than the sum of all of them.
+
+        Args:
+            senders: Channel send methods (e.g. self._send_slack)
+            message: Message text
+
+        Returns:
+            True if every channel succeeded (or none were configured)
+        """
+        if len(senders) <= 1:
+            return all(send(message) for send in senders)
+
+        futures = [self._fanout_pool.submit(send, message) for send in senders]
+        # Wait on every channel before reducing (all() alone would stop at the first failure)
+        results = [future.result() for future in futures]
+        return all(results)
+
     def _check_debounce(self) -> bool:
         """Check if enough time has passed since last notification."""
-        if not self.last_notification_time:
+        if self.last_notification_time is None:
             return True
 
-        elapsed = datetime.now(timezone.utc) - self.last_notification_time
-        return elapsed.total_seconds() > (self.debounce_minutes * 60)
+        elapsed = time.monotonic() - self.last_notification_time
+        return elapsed > (self.debounce_minutes * 60)
 
     def _format_message(
         self,
@@ -92,39 +208,18 @@ class NotificationManager:
         position_size: PositionSize
     ) -> str:
         """Format notification message."""
-        # Determine action emoji and text
-        if signal.signal_type == SignalType.ENTER_LONG_SPREAD:
-            emoji = "📈"
-            action = "LONG SPREAD"
-        elif signal.signal_type == SignalType.ENTER_SHORT_SPREAD:
-            emoji = "📉"
-            action = "SHORT SPREAD"
-        elif signal.signal_type == SignalType.EXIT_POSITION:
-            emoji = "✅"
-            action = "EXIT POSITION"
-        elif signal.signal_type == SignalType.STOP_LOSS:
-            emoji = "🛑"
-            action = "STOP LOSS"
-        else:
-            emoji = "ℹ️"
-            action = "INFO"
-
-        # Build message
-        lines = [
-            f"{emoji} *BTC-ETH Stat Arb Signal*",
-            f"*Action:* {action}",
-            f"*Z-score:* {signal.zscore:.3f}",
-            f"*Beta:* {signal.beta:.3f}",
-            "",
-            f"*Positions:*",
-            f"• ETH: ${position_size.eth_notional_usd:,.0f}",
-            f"• BTC: ${position_size.btc_notional_usd:,.0f}",
-            "",
-            f"*Reason:* {signal.reason}",
-            f"*Time:* {signal.timestamp.strftime('%Y-%m-%d %H:%M UTC')}"
-        ]
-
-        return "\n".join(lines)
+        emoji, action = _SLACK_DISPATCH.get(signal.signal_type, _SLACK_DEFAULT)
+
+        return _MSG_TEMPLATE.format(
+            emoji=emoji,
+            action=action,
+            zscore=signal.zscore,
+            beta=signal.beta,
+            eth_notional=position_size.eth_notional_usd,
+            btc_notional=position_size.btc_notional_usd,
+            reason=signal.reason,
+            timestamp=signal.timestamp
+        )
 
     def _send_slack(self, message: str) -> bool:
         """Send message to Slack."""
@@ -135,7 +230,7 @@ class NotificationManager:
                 "icon_emoji": ":chart_with_upwards_trend:"
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.slack_webhook,
                 json=payload,
                 timeout=10
@@ -145,48 +240,55 @@ class NotificationManager:
                 self.logger.info("Slack notification sent")
                 return True
             else:
-                self.logger.error(f"Slack error: {response.status_code}")
+                self.logger.error("Slack error: %s", response.status_code)
                 return False
 
         except Exception as e:
-            self.logger.error(f"Slack notification failed: {e}")
+            self.logger.error("Slack notification failed: %s", e)
             return False
 
     def _send_telegram(self, message: str) -> bool:
         """Send message to Telegram."""
         try:
-            url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
-
             payload = {
                 "chat_id": self.telegram_chat_id,
                 "text": message,
                 "parse_mode": "Markdown"
             }
 
-            response = requests.post(url, json=payload, timeout=10)
+            response = self.session.post(self.telegram_url, json=payload, timeout=10)
+
+            # Telegram reports flood-control waits in the body rather than a header
+            if response.status_code == 429:
+                try:
+                    retry_after = float(response.json()["parameters"]["retry_after"])
+                except (ValueError, KeyError, TypeError):
+                    retry_after = 1.0
+                time.sleep(min(retry_after, MAX_RETRY_AFTER_SEC))
+                response = self.session.post(self.telegram_url, json=payload, timeout=10)
 
             if response.status_code == 200:
                 self.logger.info("Telegram notification sent")
                 return True
             else:
-                self.logger.error(f"Telegram error: {response.status_code}")
+                self.logger.error("Telegram error: %s", response.status_code)
                 return False
 
         except Exception as e:
-            self.logger.error(f"Telegram notification failed: {e}")
+            self.logger.error("Telegram notification failed: %s", e)
             return False
 
     def _send_discord(self, content: str) -> bool:
         """Send a message to Discord via incoming webhook."""
         try:
-            resp = requests.post(self.discord_webhook, json={"content": content}, timeout=10)
+            resp = self.session.post(self.discord_webhook, json={"content": content}, timeout=10)
             if resp.status_code in (200, 204):
                 self.logger.info("Discord notification sent")
                 return True
-            self.logger.error(f"Discord error: {resp.status_code} {resp.text}")
+            self.logger.error("Discord error: %s %s", resp.status_code, resp.text)
             return False
         except Exception as e:
-            self.logger.error(f"Discord notification failed: {e}")
+            self.logger.error("Discord notification failed: %s", e)
             return False
 
     def send_error_notification(self, error_message: str) -> bool:
@@ -196,14 +298,40 @@ class NotificationManager:
 
         message = f"⚠️ *Trading System Error*\n\n{error_message}\n\n_Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}_"
 
-        success = True
+        senders = []
         if self.slack_enabled and self.slack_webhook:
-            success = success and self._send_slack(message)
+            senders.append(self._send_slack)
 
         if self.telegram_enabled and self.telegram_token:
-            success = success and self._send_telegram(message)
+            senders.append(self._send_telegram)
 
         if self.discord_webhook:
-            success = success and self._send_discord(message)
-
-        return success
+            senders.append(self._send_discord)
+
+        return self._send_all(senders, message)
+
+
+# Notifier instances shared within a process, keyed by their channel settings
+_NOTIFIER_CACHE: Dict[Tuple, NotificationManager] = {}
+
+
+def get_notifier(config) -> NotificationManager:
+    """
+    Get a shared NotificationManager for the given configuration.
+
+    Reusing the instance keeps its HTTP connection pool (and TLS sessions) warm
+    across runs when the scanner is hosted in a long-running process. One-shot
+    invocations (e.g. cron) still build a fresh instance each time.
+    """
+    key = tuple(
+        config.get(f"notifications.{name}")
+        for name in (
+            "enabled", "slack_enabled", "slack_webhook", "telegram_enabled",
+            "telegram_token", "telegram_chat_id", "discord_webhook", "debounce_minutes"
+        )
+    )
+    notifier = _NOTIFIER_CACHE.get(key)
+    if notifier is None:
+        notifier = NotificationManager(config)
+        _NOTIFIER_CACHE[key] = notifier
+    return notifier
@@ -1,17 +1,68 @@
 """Trade ticket generation and formatting."""
 
 import json
+import os
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when unavailable
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional; only needed for MessagePack tickets
+    msgspec = None
+
 from src.strategy.state import TradingSignal, SignalType
 from src.strategy.sizing import PositionSize
 
+# Action label template and (Y leg, X leg) sides per signal type
+_TICKET_DISPATCH = {
+    SignalType.ENTER_LONG_SPREAD: ("ENTER Long Spread ({y} long / {x} short)", "LONG", "SHORT"),
+    SignalType.ENTER_SHORT_SPREAD: ("ENTER Short Spread ({y} short / {x} long)", "SHORT", "LONG"),
+    SignalType.EXIT_POSITION: ("EXIT Position", "CLOSE", "CLOSE"),
+    SignalType.STOP_LOSS: ("STOP LOSS Triggered", "CLOSE", "CLOSE"),
+}
+_TICKET_DEFAULT = ("NO ACTION", "NONE", "NONE")
+
+
+def _msgpack_enc_hook(obj):
+    """Convert numpy scalars (e.g. z-scores from pandas) to builtin types."""
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise NotImplementedError(f"Cannot encode {type(obj).__name__} as MessagePack")
+
+
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder(enc_hook=_msgpack_enc_hook) if msgspec else None
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write pre-encoded bytes with raw fd syscalls (skips buffered text IO)."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
 
 class TradeTicketGenerator:
     """Generate human-readable trade tickets."""
 
+    # Static ticket framing, built once at class definition
+    _HEADER = "\n".join(["=" * 5, "TRADE", "=" * 5])
+    _FOOTER = "\n".join(["===", "END", "==="])
+
+    def __init__(self):
+        """Initialize ticket generator and ensure the output directory exists."""
+        self._ticket_dir = Path("signals")
+        self._ticket_dir.mkdir(parents=True, exist_ok=True)
+
     def generate_ticket(
         self,
         signal: TradingSignal,
@@ -35,55 +86,36 @@ class TradeTicketGenerator:
         y_name = (y_symbol.split("/")[0] if "/" in y_symbol else y_symbol)
         x_name = (x_symbol.split("/")[0] if "/" in x_symbol else x_symbol)
 
-        # Determine action
-        if signal.signal_type == SignalType.ENTER_LONG_SPREAD:
-            action = f"ENTER Long Spread ({y_name} long / {x_name} short)"
-            y_side = "LONG"
-            x_side = "SHORT"
-        elif signal.signal_type == SignalType.ENTER_SHORT_SPREAD:
-            action = f"ENTER Short Spread ({y_name} short / {x_name} long)"
-            y_side = "SHORT"
-            x_side = "LONG"
-        elif signal.signal_type == SignalType.EXIT_POSITION:
-            action = "EXIT Position"
-            y_side = "CLOSE"
-            x_side = "CLOSE"
-        elif signal.signal_type == SignalType.STOP_LOSS:
-            action = "STOP LOSS Triggered"
-            y_side = "CLOSE"
-            x_side = "CLOSE"
-        else:
-            action = "NO ACTION"
-            y_side = "NONE"
-            x_side = "NONE"
-
-        # Build ticket in the requested compact format
-        ticket_lines = [
-            "=" * 5,
-            "TRADE",
-            "=" * 5,
-            "",
-            f"Signal: {action}",
-            f"  Z-score: {signal.zscore:.3f}",
-            f"  Beta (hedge ratio): {signal.beta:.3f}",
-            f"  Spread: {signal.spread:.4f}",
-            f"  {x_name} Price: ${signal.btc_price:,.2f}",
-            f"  {y_name} Price: ${signal.eth_price:,.2f}",
-            "",
-            "Position Details:",
-            f"  {y_name}: {y_side} ${position_size.eth_notional_usd:,.2f} ({position_size.eth_units:.4f} {y_name})",
-            f"  {x_name}: {x_side} ${position_size.btc_notional_usd:,.2f} ({position_size.btc_units:.6f} {x_name})",
-            f"  Total Notional: ${position_size.total_notional:,.2f}",
-            "===",
-            "END",
-            "===",
-        ]
+        # Determine action and leg sides
+        action_template, y_side, x_side = _TICKET_DISPATCH.get(signal.signal_type, _TICKET_DEFAULT)
+        action = action_template.format(y=y_name, x=x_name)
 
+        # Build ticket in the requested compact format (one formatting pass)
         # Note: Funding info intentionally omitted in compact format
-
-        return "\n".join(ticket_lines)
-
-    def save_ticket(self, ticket: str, run_id: str, pair_slug: Optional[str] = None) -> Path:
+        return (
+            f"{self._HEADER}\n"
+            "\n"
+            f"Signal: {action}\n"
+            f"  Z-score: {signal.zscore:.3f}\n"
+            f"  Beta (hedge ratio): {signal.beta:.3f}\n"
+            f"  Spread: {signal.spread:.4f}\n"
+            f"  {x_name} Price: ${signal.btc_price:,.2f}\n"
+            f"  {y_name} Price: ${signal.eth_price:,.2f}\n"
+            "\n"
+            "Position Details:\n"
+            f"  {y_name}: {y_side} ${position_size.eth_notional_usd:,.2f} ({position_size.eth_units:.4f} {y_name})\n"
+            f"  {x_name}: {x_side} ${position_size.btc_notional_usd:,.2f} ({position_size.btc_units:.6f} {x_name})\n"
+            f"  Total Notional: ${position_size.total_notional:,.2f}\n"
+            f"{self._FOOTER}"
+        )
+
+    def save_ticket(
+        self,
+        ticket: str,
+        run_id: str,
+        pair_slug: Optional[str] = None,
+        timestamp: Optional[str] = None
+    ) -> Path:
         """
         Save trade ticket to file.
 
@@ -91,22 +123,21 @@ class TradeTicketGenerator:
             ticket: Formatted ticket string
             run_id: Run identifier
             pair_slug: Optional safe pair identifier to avoid filename collisions
+            timestamp: Optional precomputed filename timestamp (e.g. shared across a run)
 
         Returns:
             Path to saved ticket file
         """
-        ticket_dir = Path("signals")
-        ticket_dir.mkdir(parents=True, exist_ok=True)
+        ticket_dir = self._ticket_dir
 
-        # High-resolution timestamp to avoid collisions within the same second
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+        if timestamp is None:
+            timestamp = self._timestamp()
 
         # Optional pair slug helps keep files unique and discoverable per pair
         suffix = f"_{pair_slug}" if pair_slug else ""
         ticket_file = ticket_dir / f"ticket_{timestamp}_{run_id}{suffix}.txt"
 
-        with open(ticket_file, 'w') as f:
-            f.write(ticket)
+        _write_bytes(ticket_file, ticket.encode("utf-8"))
 
         return ticket_file
 
@@ -115,7 +146,8 @@ class TradeTicketGenerator:
         signal: TradingSignal,
         position_size: PositionSize,
         run_id: str,
-        pair_slug: Optional[str] = None
+        pair_slug: Optional[str] = None,
+        timestamp: Optional[str] = None
     ) -> Path:
         """
         Save ticket data as JSON for programmatic access.
@@ -124,18 +156,73 @@ class TradeTicketGenerator:
             signal: Trading signal
             position_size: Position sizing information
             run_id: Run identifier
+            pair_slug: Optional safe pair identifier to avoid filename collisions
+            timestamp: Optional precomputed filename timestamp (pass the one used
+                for save_ticket so the .txt and .json files pair up)
 
         Returns:
             Path to saved JSON file
         """
-        ticket_dir = Path("signals")
-        ticket_dir.mkdir(parents=True, exist_ok=True)
+        ticket_dir = self._ticket_dir
 
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+        if timestamp is None:
+            timestamp = self._timestamp()
         suffix = f"_{pair_slug}" if pair_slug else ""
         json_file = ticket_dir / f"signal_{timestamp}_{run_id}{suffix}.json"
 
-        data = {
+        _write_bytes(json_file, self._encode_json(self._ticket_data(signal, position_size)))
+
+        return json_file
+
+    def save_ticket_msgpack(
+        self,
+        signal: TradingSignal,
+        position_size: PositionSize,
+        run_id: str,
+        pair_slug: Optional[str] = None,
+        timestamp: Optional[str] = None
+    ) -> Path:
+        """
+        Save ticket data as a length-prefixed MessagePack frame.
+
+        Compact, fast-to-encode alternative to save_ticket_json for programmatic
+        consumers. The file holds a 4-byte big-endian payload length followed by
+        the MessagePack-encoded ticket data (same fields as the JSON file).
+
+        Args:
+            signal: Trading signal
+            position_size: Position sizing information
+            run_id: Run identifier
+            pair_slug: Optional safe pair identifier to avoid filename collisions
+            timestamp: Optional precomputed filename timestamp
+
+        Returns:
+            Path to saved MessagePack file
+        """
+        if _MSGPACK_ENCODER is None:
+            raise ImportError("msgspec is required for MessagePack tickets (pip install msgspec)")
+
+        ticket_dir = self._ticket_dir
+
+        if timestamp is None:
+            timestamp = self._timestamp()
+        suffix = f"_{pair_slug}" if pair_slug else ""
+        msgpack_file = ticket_dir / f"signal_{timestamp}_{run_id}{suffix}.msgpack"
+
+        payload = _MSGPACK_ENCODER.encode(self._ticket_data(signal, position_size))
+        _write_bytes(msgpack_file, len(payload).to_bytes(4, "big") + payload)
+
+        return msgpack_file
+
+    @staticmethod
+    def _timestamp() -> str:
+        """High-resolution UTC filename timestamp (avoids collisions within a second)."""
+        return datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+
+    @staticmethod
+    def _ticket_data(signal: TradingSignal, position_size: PositionSize) -> Dict:
+        """Build the JSON-serializable ticket payload."""
+        return {
             'timestamp': signal.timestamp.isoformat(),
             'signal_type': signal.signal_type.value,
             'zscore': signal.zscore,
@@ -157,7 +244,9 @@ class TradeTicketGenerator:
             }
         }
 
-        with open(json_file, 'w') as f:
-            json.dump(data, f, indent=2)
-
-        return json_file
+    @staticmethod
+    def _encode_json(data: Dict) -> bytes:
+        """Encode a payload as indented JSON bytes (orjson when available)."""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(data, indent=2).encode("utf-8")
@@ -2,13 +2,20 @@
 
 import numpy as np
 import pandas as pd
-from typing import Dict, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, Tuple, Optional, Union
+from dataclasses import dataclass, fields
 
 
-@dataclass
+@dataclass(frozen=True)
 class PositionSize:
     """Position size for each leg of the trade."""
+
+    # Explicit slots (dataclass(slots=True) needs Python 3.10): no per-instance __dict__
+    __slots__ = (
+        'eth_notional_usd', 'btc_notional_usd', 'eth_units', 'btc_units', 'total_notional',
+        'leverage', 'expected_fees', 'expected_slippage', 'risk_per_zscore'
+    )
+
     eth_notional_usd: float
     btc_notional_usd: float
     eth_units: float
@@ -19,6 +26,28 @@ class PositionSize:
     expected_slippage: float
     risk_per_zscore: float
 
+    # The default slots state restore uses setattr, which a frozen dataclass
+    # rejects, so pickle/copy/deepcopy need these explicitly
+    def __getstate__(self) -> tuple:
+        """Field values in __slots__ order."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore fields, bypassing the frozen __setattr__."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_record(cls, record: np.void) -> "PositionSize":
+        """Build a PositionSize from one row of a POSITION_SIZE_DTYPE array."""
+        return cls(*record.tolist())
+
+
+# Structured dtype mirroring PositionSize, used for batch sizing results
+POSITION_SIZE_DTYPE = np.dtype([(f.name, np.float64) for f in fields(PositionSize)])
+
+ArrayLike = Union[float, np.ndarray]
+
 
 class VolatilityTargetingSizer:
     """
@@ -28,6 +57,9 @@ class VolatilityTargetingSizer:
     results in a target P&L in USD.
     """
 
+    # Shared result for trades below the minimum size (PositionSize is frozen)
+    _ZERO_POSITION = PositionSize(0, 0, 0, 0, 0, 0, 0, 0, 0)
+
     def __init__(
         self,
         target_sigma_usd: float = 200.0,
@@ -55,6 +87,10 @@ class VolatilityTargetingSizer:
         self.slippage_bps = slippage_bps
         self.min_notional_per_leg = min_notional_per_leg
 
+        # Cost rates as fractions, converted from bps once
+        self._fee_frac = fee_bps / 10000
+        self._slip_frac = slippage_bps / 10000
+
     def calculate_position_size(
         self,
         beta: float,
@@ -89,13 +125,19 @@ class VolatilityTargetingSizer:
         # where N_ETH is the ETH notional
 
         # Therefore: N_ETH = target_sigma_usd / spread_std
-        eth_notional_base = self.target_sigma_usd / spread_std if spread_std > 0 else 0
+        if not spread_std > 0:
+            return self._ZERO_POSITION
+        eth_notional_base = self.target_sigma_usd / spread_std
 
         # Calculate BTC notional to maintain hedge ratio
         # We need: N_BTC / N_ETH ≈ beta * (P_BTC / P_ETH)
         # So: N_BTC = N_ETH * beta * (P_BTC / P_ETH)
         btc_notional_base = eth_notional_base * beta
 
+        # Limits below only scale legs down, so an undersized base stays undersized
+        if eth_notional_base < self.min_notional_per_leg or btc_notional_base < self.min_notional_per_leg:
+            return self._ZERO_POSITION
+
         # Apply position limits
         eth_notional = min(eth_notional_base, self.max_notional_per_leg)
         btc_notional = min(btc_notional_base, self.max_notional_per_leg)
@@ -139,11 +181,11 @@ class VolatilityTargetingSizer:
         leverage = total_notional / capital if capital and capital > 0 else 0
 
         # Calculate expected costs
-        expected_fees = total_notional * (self.fee_bps / 10000)
-        expected_slippage = total_notional * (self.slippage_bps / 10000)
+        expected_fees = total_notional * self._fee_frac
+        expected_slippage = total_notional * self._slip_frac
 
         # Calculate actual risk per z-score
-        risk_per_zscore = eth_notional * spread_std if spread_std > 0 else 0
+        risk_per_zscore = eth_notional * spread_std
 
         return PositionSize(
             eth_notional_usd=eth_notional,
@@ -157,6 +199,89 @@ class VolatilityTargetingSizer:
             risk_per_zscore=risk_per_zscore
         )
 
+    def calculate_position_size_batch(
+        self,
+        beta: ArrayLike,
+        spread_std: ArrayLike,
+        btc_price: ArrayLike,
+        eth_price: ArrayLike,
+        btc_adv_usd: Optional[ArrayLike] = None,
+        eth_adv_usd: Optional[ArrayLike] = None,
+        capital: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_position_size over many pairs at once.
+
+        Inputs broadcast against each other and follow the same rules as the
+        scalar method, element by element.
+
+        Args:
+            beta: Hedge ratios
+            spread_std: Spread standard deviations
+            btc_price: Current X-leg prices
+            eth_price: Current Y-leg prices
+            btc_adv_usd: Optional X-leg average daily volumes in USD
+            eth_adv_usd: Optional Y-leg average daily volumes in USD
+            capital: Available capital (for leverage calculation)
+
+        Returns:
+            Structured array of POSITION_SIZE_DTYPE (use PositionSize.from_record
+            to get a PositionSize for one row)
+        """
+        beta, spread_std, btc_price, eth_price = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.float64) for a in (beta, spread_std, btc_price, eth_price))
+        )
+        max_leg = self.max_notional_per_leg
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            has_std = spread_std > 0
+            eth_base = np.where(has_std, self.target_sigma_usd / spread_std, 0.0)
+            btc_base = eth_base * beta
+
+            # Apply position limits, scaling both legs to keep the hedge ratio
+            eth_notional = np.minimum(eth_base, max_leg)
+            btc_notional = np.minimum(btc_base, max_leg)
+            limited = (eth_notional < eth_base) | (btc_notional < btc_base)
+            scale = np.minimum(max_leg / eth_base, max_leg / btc_base)
+            eth_notional = np.where(limited, eth_base * scale, eth_notional)
+            btc_notional = np.where(limited, btc_base * scale, btc_notional)
+
+            # Apply ADV constraints if provided
+            if btc_adv_usd is not None:
+                max_btc = np.nan_to_num(np.asarray(btc_adv_usd, dtype=np.float64)) * self.max_adv_fraction
+                over = (max_btc > 0) & (btc_notional > max_btc)
+                scale = np.where(over, max_btc / btc_notional, 1.0)
+                btc_notional = btc_notional * scale
+                eth_notional = eth_notional * scale
+
+            if eth_adv_usd is not None:
+                max_eth = np.nan_to_num(np.asarray(eth_adv_usd, dtype=np.float64)) * self.max_adv_fraction
+                over = (max_eth > 0) & (eth_notional > max_eth)
+                scale = np.where(over, max_eth / eth_notional, 1.0)
+                eth_notional = eth_notional * scale
+                btc_notional = btc_notional * scale
+
+            # Check minimum size
+            too_small = (eth_notional < self.min_notional_per_leg) | (btc_notional < self.min_notional_per_leg)
+            eth_notional = np.where(too_small, 0.0, eth_notional)
+            btc_notional = np.where(too_small, 0.0, btc_notional)
+
+            out = np.zeros(eth_notional.shape, dtype=POSITION_SIZE_DTYPE)
+            out['eth_notional_usd'] = eth_notional
+            out['btc_notional_usd'] = btc_notional
+            out['eth_units'] = np.where(eth_price > 0, eth_notional / eth_price, 0.0)
+            out['btc_units'] = np.where(btc_price > 0, btc_notional / btc_price, 0.0)
+
+            total_notional = eth_notional + btc_notional
+            out['total_notional'] = total_notional
+            if capital and capital > 0:
+                out['leverage'] = total_notional / capital
+            out['expected_fees'] = total_notional * self._fee_frac
+            out['expected_slippage'] = total_notional * self._slip_frac
+            out['risk_per_zscore'] = np.where(has_std, eth_notional * spread_std, 0.0)
+
+        return out
+
     def calculate_kelly_fraction(
         self,
         win_rate: float,
@@ -250,25 +375,24 @@ class VolatilityTargetingSizer:
                 'max_position_pct': 0
             }
 
-        total_notional = sum(p.total_notional for p in positions.values())
-        risks = [p.risk_per_zscore for p in positions.values()]
+        n = len(positions)
+        notionals = np.fromiter((p.total_notional for p in positions.values()), dtype=np.float64, count=n)
+        risks = np.fromiter((p.risk_per_zscore for p in positions.values()), dtype=np.float64, count=n)
+
+        total_notional = float(notionals.sum())
 
         # Calculate portfolio risk considering correlations
-        if len(risks) == 1:
-            total_risk = risks[0]
-        else:
-            # Simple approximation without full correlation matrix
-            total_risk = np.sqrt(sum(r**2 for r in risks))
+        # Simple approximation without full correlation matrix
+        total_risk = float(np.sqrt(np.dot(risks, risks))) if n > 1 else float(risks[0])
 
         # Concentration metrics
-        notionals = [p.total_notional for p in positions.values()]
-        max_notional = max(notionals) if notionals else 0
-        concentration_ratio = max_notional / total_notional if total_notional > 0 else 0
+        max_notional = notionals.max()
+        concentration_ratio = float(max_notional / total_notional) if total_notional > 0 else 0
 
         return {
             'total_notional': total_notional,
             'total_risk': total_risk,
             'concentration_ratio': concentration_ratio,
             'max_position_pct': concentration_ratio * 100,
-            'n_positions': len(positions)
+            'n_positions': n
         }
\ No newline at end of file
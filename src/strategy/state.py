@@ -1,5 +1,8 @@
 """State machine for trade signal generation."""
 
+import atexit
+import time
+import weakref
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime
@@ -7,6 +10,7 @@ from typing import Optional, List, Tuple
 import pandas as pd
 import numpy as np
 import json
+import os
 from pathlib import Path
 
 
@@ -26,9 +30,16 @@ class SignalType(Enum):
     NO_ACTION = "no_action"
 
 
-@dataclass
+@dataclass(frozen=True)
 class TradingSignal:
     """Trading signal with metadata."""
+
+    # Explicit slots (dataclass(slots=True) needs Python 3.10): no per-instance __dict__
+    __slots__ = (
+        'timestamp', 'signal_type', 'zscore', 'beta', 'spread', 'reason',
+        'btc_price', 'eth_price', 'previous_state', 'new_state'
+    )
+
     timestamp: datetime
     signal_type: SignalType
     zscore: float
@@ -40,6 +51,128 @@ class TradingSignal:
     previous_state: PositionState
     new_state: PositionState
 
+    # The default slots state restore uses setattr, which a frozen dataclass
+    # rejects, so pickle/copy/deepcopy need these explicitly
+    def __getstate__(self) -> tuple:
+        """Field values in __slots__ order."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore fields, bypassing the frozen __setattr__."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+# Integer state codes used internally by the state machine and the JIT kernel
+_NEUTRAL, _LONG, _SHORT = 0, 1, 2
+_STATE_BY_CODE = (PositionState.NEUTRAL, PositionState.LONG_SPREAD, PositionState.SHORT_SPREAD)
+_CODE_BY_STATE = {state: code for code, state in enumerate(_STATE_BY_CODE)}
+# Kernel signal codes -> signal type and the state after the signal
+_SIG_BY_CODE = (
+    SignalType.ENTER_LONG_SPREAD,
+    SignalType.ENTER_SHORT_SPREAD,
+    SignalType.EXIT_POSITION,
+    SignalType.STOP_LOSS,
+)
+_NEW_STATE_BY_CODE = (
+    PositionState.LONG_SPREAD,
+    PositionState.SHORT_SPREAD,
+    PositionState.NEUTRAL,
+    PositionState.NEUTRAL,
+)
+
+
+def _run_state_machine(
+    z: np.ndarray,
+    z_in: float,
+    z_out: float,
+    z_stop: float,
+    state: int,
+    previous: float
+) -> Tuple[np.ndarray, np.ndarray, int, float]:
+    """
+    Walk z-scores through the entry/exit state machine (same rules as process_tick).
+
+    Args:
+        z: Z-scores (NaN ticks are skipped and do not update the previous value)
+        z_in: Entry threshold
+        z_out: Exit threshold
+        z_stop: Stop loss threshold
+        state: Starting state code (0 neutral, 1 long spread, 2 short spread)
+        previous: Previous z-score (NaN if none)
+
+    Returns:
+        Tuple of (event bar indices, event signal codes, final state, final previous z)
+    """
+    n = len(z)
+    event_idx = np.empty(n, dtype=np.int64)
+    event_code = np.empty(n, dtype=np.int8)
+    count = 0
+
+    for i in range(n):
+        current = z[i]
+        if np.isnan(current):
+            continue
+
+        code = -1
+        if state == _NEUTRAL:
+            # Entries only on crossings
+            if not np.isnan(previous):
+                if previous >= -z_in and current < -z_in:
+                    code = 0
+                    state = _LONG
+                elif previous <= z_in and current > z_in:
+                    code = 1
+                    state = _SHORT
+        else:
+            abs_z = abs(current)
+            if abs_z > z_stop:
+                code = 3
+                state = _NEUTRAL
+            elif abs_z < z_out:
+                code = 2
+                state = _NEUTRAL
+
+        if code >= 0:
+            event_idx[count] = i
+            event_code[count] = code
+            count += 1
+        previous = current
+
+    return event_idx[:count], event_code[:count], state, previous
+
+
+# Compiled sweep, built on first batch use (see _get_state_kernel)
+_state_kernel = None
+
+
+def _get_state_kernel():
+    """
+    Return the state-machine sweep, JIT-compiled with Numba when available.
+
+    Numba is imported lazily so live ticks (which never use the sweep) do not
+    pay its import cost; without Numba the plain Python loop is used.
+    """
+    global _state_kernel
+    if _state_kernel is None:
+        try:
+            from numba import jit
+        except ImportError:
+            _state_kernel = _run_state_machine
+        else:
+            _state_kernel = jit(nopython=True, cache=True)(_run_state_machine)
+    return _state_kernel
+
+
+# Machines with unsaved state, flushed at interpreter exit
+_PENDING_FLUSH = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_pending_states():
+    for machine in list(_PENDING_FLUSH):
+        machine.flush(force=True)
+
 
 class TradingStateMachine:
     """
@@ -57,7 +190,8 @@ class TradingStateMachine:
         z_in: float = 2.0,
         z_out: float = 0.5,
         z_stop: float = 3.5,
-        state_file: Optional[str] = None
+        state_file: Optional[str] = None,
+        persist_interval_sec: float = 0.0
     ):
         """
         Initialize trading state machine.
@@ -67,11 +201,34 @@ class TradingStateMachine:
             z_out: Exit threshold for z-score
             z_stop: Stop loss threshold for z-score
             state_file: Path to persist state between runs
+            persist_interval_sec: Minimum seconds between state writes from
+                process_tick (0 writes on every signal); pending changes are
+                always written by flush(force=True), reset() and at exit
         """
         self.z_in = z_in
         self.z_out = z_out
         self.z_stop = z_stop
         self.state_file = Path(state_file) if state_file else None
+        self.persist_interval_sec = persist_interval_sec
+
+        # Squared exit thresholds: compare z*z instead of calling abs() per tick
+        self._z_stop_sq = z_stop * z_stop
+        self._z_out_sq = z_out * z_out
+
+        # Signal reasons depend only on the thresholds, so format them once
+        self._reason_enter_long = f"Z-score crossed below -{z_in:.1f}"
+        self._reason_enter_short = f"Z-score crossed above {z_in:.1f}"
+        self._reason_exit = f"Exit signal (|z| < {z_out:.1f})"
+        self._reason_stop = f"Stop loss triggered (|z| > {z_stop:.1f})"
+
+        # Persistence bookkeeping: unsaved changes and monotonic time of last write
+        self._persist = self.state_file is not None
+        self._dirty = False
+        self._last_save = None
+        if self.state_file:
+            # Create the directory once; writes go to a temp file then os.replace
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            self._state_tmp = self.state_file.with_suffix(self.state_file.suffix + '.tmp')
 
         # Current state
         self.current_state = PositionState.NEUTRAL
@@ -86,6 +243,15 @@ class TradingStateMachine:
         if self.state_file and self.state_file.exists():
             self.load_state()
 
+    @property
+    def current_state(self) -> PositionState:
+        """Current position state (stored internally as an integer code)."""
+        return _STATE_BY_CODE[self._state_i]
+
+    @current_state.setter
+    def current_state(self, state: PositionState):
+        self._state_i = _CODE_BY_STATE[state]
+
     def save_state(self):
         """Persist current state to file."""
         if not self.state_file:
@@ -99,9 +265,33 @@ class TradingStateMachine:
             'previous_zscore': self.previous_zscore
         }
 
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_file, 'w') as f:
+        # Atomic replace: a crash mid-write never leaves a truncated state file
+        with open(self._state_tmp, 'w') as f:
             json.dump(state_data, f, indent=2)
+        os.replace(self._state_tmp, self.state_file)
+
+        self._dirty = False
+        self._last_save = time.monotonic()
+        _PENDING_FLUSH.discard(self)
+
+    def _mark_dirty(self):
+        """Record that the persisted state is out of date."""
+        if self._persist and not self._dirty:
+            self._dirty = True
+            _PENDING_FLUSH.add(self)
+
+    def flush(self, force: bool = False):
+        """
+        Write pending state changes to the state file.
+
+        Args:
+            force: Write now regardless of persist_interval_sec
+        """
+        if not self._dirty:
+            return
+        if (force or self._last_save is None or
+                time.monotonic() - self._last_save >= self.persist_interval_sec):
+            self.save_state()
 
     def load_state(self):
         """Load persisted state from file."""
@@ -125,28 +315,47 @@ class TradingStateMachine:
         except Exception as e:
             print(f"Error loading state: {e}")
 
-    def _is_crossing(self, previous: float, current: float, threshold: float, direction: str) -> bool:
+    @staticmethod
+    def _crossed_below(previous: float, current: float, threshold: float) -> bool:
         """
-        Check if z-score crosses a threshold.
+        Check if z-score crosses below a threshold.
 
-        Args:
-            previous: Previous z-score
-            current: Current z-score
-            threshold: Threshold value
-            direction: 'above' or 'below'
+        Comparisons against NaN are always False, so NaN inputs never cross.
+        """
+        return previous >= threshold and current < threshold
 
-        Returns:
-            True if crossing detected
+    @staticmethod
+    def _crossed_above(previous: float, current: float, threshold: float) -> bool:
         """
-        if pd.isna(previous) or pd.isna(current):
-            return False
+        Check if z-score crosses above a threshold.
 
-        if direction == 'above':
-            return previous <= threshold and current > threshold
-        elif direction == 'below':
-            return previous >= threshold and current < threshold
-        else:
-            raise ValueError(f"Invalid direction: {direction}")
+        Comparisons against NaN are always False, so NaN inputs never cross.
+        """
+        return previous <= threshold and current > threshold
+
+    def _no_action(
+        self,
+        timestamp: datetime,
+        zscore: float,
+        beta: float,
+        spread: float,
+        btc_price: float,
+        eth_price: float,
+        reason: str = ""
+    ) -> TradingSignal:
+        """Build a NO_ACTION signal that leaves the current state unchanged."""
+        return TradingSignal(
+            timestamp=timestamp,
+            signal_type=SignalType.NO_ACTION,
+            zscore=zscore,
+            beta=beta,
+            spread=spread,
+            reason=reason,
+            btc_price=btc_price,
+            eth_price=eth_price,
+            previous_state=self.current_state,
+            new_state=self.current_state
+        )
 
     def process_tick(
         self,
@@ -169,83 +378,89 @@ class TradingStateMachine:
             eth_price: Current ETH price
 
         Returns:
-            TradingSignal object
+            TradingSignal object (NO_ACTION when nothing fires)
+        """
+        signal = self._step(timestamp, zscore, beta, spread, btc_price, eth_price)
+        if signal is not None:
+            self.flush()
+        else:
+            reason = "Invalid z-score" if pd.isna(zscore) else ""
+            return self._no_action(timestamp, zscore, beta, spread, btc_price, eth_price, reason)
+        return signal
+
+    def _step(
+        self,
+        timestamp: datetime,
+        zscore: float,
+        beta: float,
+        spread: float,
+        btc_price: float,
+        eth_price: float
+    ) -> Optional[TradingSignal]:
+        """
+        Advance the state machine by one tick.
+
+        Same as process_tick, but returns None instead of allocating a
+        NO_ACTION signal, which is the result for almost every bar.
         """
         # Skip if z-score is NaN
         if pd.isna(zscore):
-            return TradingSignal(
-                timestamp=timestamp,
-                signal_type=SignalType.NO_ACTION,
-                zscore=zscore,
-                beta=beta,
-                spread=spread,
-                reason="Invalid z-score",
-                btc_price=btc_price,
-                eth_price=eth_price,
-                previous_state=self.current_state,
-                new_state=self.current_state
-            )
+            return None
+
+        z_in = self.z_in
+        state = self._state_i
+
+        # Fast path for the common case: flat and inside the entry band, so no
+        # entry crossing is possible this tick
+        if state == _NEUTRAL and -z_in <= zscore <= z_in:
+            self.previous_zscore = zscore
+            return None
 
         signal_type = SignalType.NO_ACTION
-        reason = ""
-        new_state = self.current_state
+        new_state = state
 
         # Check for signals based on current state
-        if self.current_state == PositionState.NEUTRAL:
+        if state == _NEUTRAL:
             # Check for entry signals (only on crossing)
-            if self.previous_zscore is not None:
-                if self._is_crossing(self.previous_zscore, zscore, -self.z_in, 'below'):
+            previous = self.previous_zscore
+            if previous is not None:
+                if self._crossed_below(previous, zscore, -z_in):
                     signal_type = SignalType.ENTER_LONG_SPREAD
-                    new_state = PositionState.LONG_SPREAD
-                    reason = f"Z-score crossed below -{self.z_in:.1f}"
-                    self.entry_zscore = zscore
-                    self.entry_timestamp = timestamp
-                    self.entry_beta = beta
+                    new_state = _LONG
+                    reason = self._reason_enter_long
 
-                elif self._is_crossing(self.previous_zscore, zscore, self.z_in, 'above'):
+                elif self._crossed_above(previous, zscore, z_in):
                     signal_type = SignalType.ENTER_SHORT_SPREAD
-                    new_state = PositionState.SHORT_SPREAD
-                    reason = f"Z-score crossed above {self.z_in:.1f}"
-                    self.entry_zscore = zscore
-                    self.entry_timestamp = timestamp
-                    self.entry_beta = beta
-
-        elif self.current_state == PositionState.LONG_SPREAD:
-            # Check for exit conditions
-            if abs(zscore) > self.z_stop:
-                signal_type = SignalType.STOP_LOSS
-                new_state = PositionState.NEUTRAL
-                reason = f"Stop loss triggered (|z| > {self.z_stop:.1f})"
-                self.entry_zscore = None
-                self.entry_timestamp = None
-                self.entry_beta = None
+                    new_state = _SHORT
+                    reason = self._reason_enter_short
 
-            elif abs(zscore) < self.z_out:
-                signal_type = SignalType.EXIT_POSITION
-                new_state = PositionState.NEUTRAL
-                reason = f"Exit signal (|z| < {self.z_out:.1f})"
-                self.entry_zscore = None
-                self.entry_timestamp = None
-                self.entry_beta = None
+            if new_state != _NEUTRAL:
+                self.entry_zscore = zscore
+                self.entry_timestamp = timestamp
+                self.entry_beta = beta
 
-        elif self.current_state == PositionState.SHORT_SPREAD:
-            # Check for exit conditions
-            if abs(zscore) > self.z_stop:
+        else:
+            # In a position (long or short spread): check for exit conditions
+            z_sq = zscore * zscore
+            if z_sq > self._z_stop_sq:
                 signal_type = SignalType.STOP_LOSS
-                new_state = PositionState.NEUTRAL
-                reason = f"Stop loss triggered (|z| > {self.z_stop:.1f})"
-                self.entry_zscore = None
-                self.entry_timestamp = None
-                self.entry_beta = None
+                new_state = _NEUTRAL
+                reason = self._reason_stop
 
-            elif abs(zscore) < self.z_out:
+            elif z_sq < self._z_out_sq:
                 signal_type = SignalType.EXIT_POSITION
-                new_state = PositionState.NEUTRAL
-                reason = f"Exit signal (|z| < {self.z_out:.1f})"
+                new_state = _NEUTRAL
+                reason = self._reason_exit
+
+            if new_state == _NEUTRAL:
                 self.entry_zscore = None
                 self.entry_timestamp = None
                 self.entry_beta = None
 
+        if signal_type is SignalType.NO_ACTION:
+            self.previous_zscore = zscore
+            return None
+
         # Create signal
         signal = TradingSignal(
             timestamp=timestamp,
@@ -256,17 +471,14 @@ class TradingStateMachine:
             reason=reason,
             btc_price=btc_price,
             eth_price=eth_price,
-            previous_state=self.current_state,
-            new_state=new_state
+            previous_state=_STATE_BY_CODE[state],
+            new_state=_STATE_BY_CODE[new_state]
         )
 
         # Update state
-        self.current_state = new_state
+        self._state_i = new_state
         self.previous_zscore = zscore
-
-        # Save state if changed
-        if signal_type != SignalType.NO_ACTION:
-            self.save_state()
+        self._mark_dirty()
 
         return signal
 
@@ -282,19 +494,98 @@ class TradingStateMachine:
         """
         signals = []
 
-        for idx, row in signals_df.iterrows():
-            signal = self.process_tick(
-                timestamp=idx,
-                zscore=row['zscore'],
-                beta=row['beta'],
-                spread=row['spread'],
-                btc_price=row['btc_price'],
-                eth_price=row['eth_price']
-            )
+        # Iterate raw column arrays rather than building a Series per row
+        columns = zip(
+            signals_df.index,
+            signals_df['zscore'].to_numpy(),
+            signals_df['beta'].to_numpy(),
+            signals_df['spread'].to_numpy(),
+            signals_df['btc_price'].to_numpy(),
+            signals_df['eth_price'].to_numpy()
+        )
+        for timestamp, zscore, beta, spread, btc_price, eth_price in columns:
+            signal = self._step(timestamp, zscore, beta, spread, btc_price, eth_price)
 
-            if signal.signal_type != SignalType.NO_ACTION:
+            if signal is not None:
                 signals.append(signal)
 
+        # One write for the whole batch rather than one per signal
+        self.flush(force=True)
+
+        return signals
+
+    def process_dataframe_vectorized(self, signals_df: pd.DataFrame) -> List[TradingSignal]:
+        """
+        Batch equivalent of process_dataframe for backtests.
+
+        The state machine runs in a kernel over the z-score column (Numba-compiled
+        when available); TradingSignal objects are only built for the (few) bars
+        that emit a signal. Emitted signals and the final machine state match
+        process_dataframe.
+
+        Args:
+            signals_df: DataFrame with columns: zscore, beta, spread, btc_price, eth_price
+
+        Returns:
+            List of TradingSignal objects
+        """
+        z = signals_df['zscore'].to_numpy(dtype=np.float64)
+        if len(z) == 0:
+            return []
+
+        event_idx, event_code, final_state, final_previous = _get_state_kernel()(
+            z, float(self.z_in), float(self.z_out), float(self.z_stop),
+            self._state_i,
+            np.nan if self.previous_zscore is None else float(self.previous_zscore)
+        )
+
+        timestamps = signals_df.index
+        beta = signals_df['beta'].to_numpy()
+        spread = signals_df['spread'].to_numpy()
+        btc_price = signals_df['btc_price'].to_numpy()
+        eth_price = signals_df['eth_price'].to_numpy()
+
+        # Indexed by kernel signal code
+        reasons = (
+            self._reason_enter_long,
+            self._reason_enter_short,
+            self._reason_exit,
+            self._reason_stop,
+        )
+
+        # Each event starts from the state the previous event left behind
+        idxs = event_idx.tolist()
+        codes = event_code.tolist()
+        previous_states = [self.current_state] + [_NEW_STATE_BY_CODE[c] for c in codes[:-1]]
+
+        signals = [
+            TradingSignal(
+                timestamps[i], _SIG_BY_CODE[c], z[i], beta[i], spread[i], reasons[c],
+                btc_price[i], eth_price[i], previous_state, _NEW_STATE_BY_CODE[c]
+            )
+            for i, c, previous_state in zip(idxs, codes, previous_states)
+        ]
+
+        # Entry bookkeeping only depends on the last event
+        if signals:
+            last = signals[-1]
+            if last.new_state is PositionState.NEUTRAL:
+                self.entry_zscore = None
+                self.entry_timestamp = None
+                self.entry_beta = None
+            else:
+                self.entry_zscore = last.zscore
+                self.entry_timestamp = last.timestamp
+                self.entry_beta = last.beta
+
+        self._state_i = final_state
+        if not np.isnan(final_previous):
+            self.previous_zscore = final_previous
+
+        if signals:
+            self._mark_dirty()
+            self.flush(force=True)
+
         return signals
 
     def reset(self):
@@ -305,8 +596,8 @@ class TradingStateMachine:
         self.entry_beta = None
         self.previous_zscore = None
 
-        if self.state_file:
-            self.save_state()
+        self._mark_dirty()
+        self.flush(force=True)
 
     def get_position_info(self) -> dict:
         """Get current position information."""
@@ -1,15 +1,51 @@
 """Configuration management utilities."""
 
+import json
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml-backed, much faster
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _flatten(tree: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Map every dotted key path in a nested dict to its value.
+
+    Intermediate sections are included too, so "a.b" maps to the "b" subtree.
+    """
+    flat = {}
+    for k, v in tree.items():
+        if not isinstance(k, str):
+            continue  # Only string keys are reachable via dot-notation
+        path = prefix + k
+        flat[path] = v
+        if isinstance(v, dict):
+            flat.update(_flatten(v, path + "."))
+    return flat
+
 
 class Config:
     """Configuration manager for the trading system."""
 
+    # Environment variable -> (config section, key) overrides
+    _ENV_OVERRIDES = (
+        # Exchange credentials
+        ("API_KEY", "exchange_credentials", "api_key"),
+        ("API_SECRET", "exchange_credentials", "api_secret"),
+        # Notification webhooks
+        ("NOTIFY_SLACK_WEBHOOK", "notifications", "slack_webhook"),
+        ("NOTIFY_DISCORD_WEBHOOK", "notifications", "discord_webhook"),
+        ("NOTIFY_TELEGRAM_TOKEN", "notifications", "telegram_token"),
+        ("NOTIFY_TELEGRAM_CHAT_ID", "notifications", "telegram_chat_id"),
+    )
+
     def __init__(self, config_path: str = "config.yaml", env_path: str = ".env"):
         """Initialize configuration from YAML and environment files."""
         # Check if .env exists and load it
@@ -32,6 +68,9 @@ class Config:
         # Override with environment variables
         self._apply_env_overrides()
 
+        # Dotted-key index for get(); call rebuild_index() after mutating self.config
+        self.rebuild_index()
+
         # Validate configuration
         self._validate_config()
 
@@ -40,35 +79,40 @@ class Config:
         if not Path(path).exists():
             raise FileNotFoundError(f"Configuration file not found: {path}")
 
-        with open(path, 'r') as f:
-            return yaml.safe_load(f)
-
-    def _apply_env_overrides(self):
-        """Apply environment variable overrides to configuration."""
-        # Exchange credentials
-        if os.getenv("API_KEY"):
-            self.config.setdefault("exchange_credentials", {})
-            self.config["exchange_credentials"]["api_key"] = os.getenv("API_KEY")
+        # Reuse a JSON copy of the parsed YAML while the file is unchanged
+        yaml_path = Path(path)
+        stat = yaml_path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        cache_path = yaml_path.with_name(f".{yaml_path.name}.cache.json")
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if cached['stamp'] == stamp:
+                return cached['config']
+        except Exception:
+            pass  # Missing, stale format or unreadable cache: parse the YAML
 
-        if os.getenv("API_SECRET"):
-            self.config.setdefault("exchange_credentials", {})
-            self.config["exchange_credentials"]["api_secret"] = os.getenv("API_SECRET")
+        with open(path, 'r') as f:
+            config = yaml.load(f, Loader=_YamlLoader)
 
-        # Notification webhooks
-        if os.getenv("NOTIFY_SLACK_WEBHOOK"):
-            self.config.setdefault("notifications", {})
-            self.config["notifications"]["slack_webhook"] = os.getenv("NOTIFY_SLACK_WEBHOOK")
-        if os.getenv("NOTIFY_DISCORD_WEBHOOK"):
-            self.config.setdefault("notifications", {})
-            self.config["notifications"]["discord_webhook"] = os.getenv("NOTIFY_DISCORD_WEBHOOK")
+        try:
+            payload = json.dumps({'stamp': stamp, 'config': config})
+            # Only cache configs JSON round-trips exactly (no dates, non-str keys)
+            if json.loads(payload)['config'] == config:
+                with open(cache_path, 'w') as f:
+                    f.write(payload)
+        except (OSError, TypeError, ValueError):
+            pass  # Read-only checkout or non-JSON values; the cache is only an optimization
 
-        if os.getenv("NOTIFY_TELEGRAM_TOKEN"):
-            self.config.setdefault("notifications", {})
-            self.config["notifications"]["telegram_token"] = os.getenv("NOTIFY_TELEGRAM_TOKEN")
+        return config
 
-        if os.getenv("NOTIFY_TELEGRAM_CHAT_ID"):
-            self.config.setdefault("notifications", {})
-            self.config["notifications"]["telegram_chat_id"] = os.getenv("NOTIFY_TELEGRAM_CHAT_ID")
+    def _apply_env_overrides(self):
+        """Apply environment variable overrides to configuration."""
+        environ = os.environ
+        for env_name, section, key in self._ENV_OVERRIDES:
+            value = environ.get(env_name)
+            if value:
+                self.config.setdefault(section, {})[key] = value
 
         # Email/SMTP support removed per user request
 
@@ -108,20 +152,14 @@ class Config:
             )
             raise ValueError(error_msg)
 
+    def rebuild_index(self):
+        """Rebuild the flattened dot-notation index used by get()."""
+        self._flat = _flatten(self.config or {})
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by dot-notation key."""
-        keys = key.split('.')
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-
-        return value
+        value = self._flat.get(key)
+        return default if value is None else value
 
     def __getitem__(self, key: str) -> Any:
         """Allow dictionary-style access."""
@@ -144,10 +182,14 @@ class Config:
 
 # Global configuration instance
 _config = None
+_config_lock = threading.Lock()
 
 def get_config(config_path: str = "config.yaml", env_path: str = ".env") -> Config:
     """Get singleton configuration instance."""
     global _config
     if _config is None:
-        _config = Config(config_path, env_path)
+        with _config_lock:
+            # Re-check: another thread may have built it while we waited
+            if _config is None:
+                _config = Config(config_path, env_path)
     return _config
@@ -1,20 +1,82 @@
 """Logging utilities."""
 
+import atexit
+import copy
 import logging
+import logging.handlers
 import json
+import queue
+import time
 from pathlib import Path
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when unavailable
+    orjson = None
+
+
+# Background thread draining queued records to the log file (see setup_logging)
+_file_listener = None
+
+
+def _stop_file_listener():
+    """Flush queued records and stop the file-writer thread."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for an in-process listener that keeps exc_info intact."""
+
+    def prepare(self, record):
+        # Resolve the message now (args may change later) but leave the
+        # traceback for the file formatter, unlike the default prepare()
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 class JSONFormatter(logging.Formatter):
-    """JSON log formatter."""
+    """
+    JSON log formatter.
+
+    Log with lazy %-style arguments (logger.debug("z=%.3f", z)) rather than
+    f-strings so disabled levels never build the message; wrap expensive
+    argument computation in logger.isEnabledFor(logging.DEBUG).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Whole-second UTC prefix of the last record, reused within the same second
+        self._ts_second = None
+        self._ts_prefix = ""
+
+    def _utc_timestamp(self, created: float) -> str:
+        """ISO-8601 UTC timestamp (microseconds) from the record's creation time."""
+        second = int(created)
+        if second != self._ts_second:
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._ts_second = second
+        return f"{self._ts_prefix}.{int((created - second) * 1_000_000):06d}"
 
     def format(self, record):
+        # Inline LogRecord.getMessage(): only apply % when there are args
+        # (records from the file queue arrive pre-formatted with args=None)
+        message = str(record.msg)
+        if record.args:
+            message = message % record.args
+
         log_obj = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': self._utc_timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
-            'message': record.getMessage(),
+            'message': message,
             'module': record.module,
             'function': record.funcName,
             'line': record.lineno
@@ -23,6 +85,8 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_obj['exception'] = self.formatException(record.exc_info)
 
+        if orjson is not None:
+            return orjson.dumps(log_obj).decode()
         return json.dumps(log_obj)
 
 
@@ -38,12 +102,15 @@ def setup_logging(log_file: str = None, log_level: str = "INFO", json_format: bo
     Returns:
         Logger instance
     """
+    global _file_listener
+
     # Create logger
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, log_level.upper()))
 
     # Remove existing handlers
     logger.handlers = []
+    _stop_file_listener()
 
     # Console handler
     console_handler = logging.StreamHandler()
@@ -67,6 +134,11 @@ def setup_logging(log_file: str = None, log_level: str = "INFO", json_format: bo
             file_handler.setFormatter(
                 logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             )
-        logger.addHandler(file_handler)
+
+        # Callers only enqueue; a listener thread does the file writes
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(_LocalQueueHandler(log_queue))
+        _file_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        _file_listener.start()
 
     return logger
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""Tests for cointegration feature calculations."""
+
+import numpy as np
+import pytest
+
+from src.features.cointegration import CointegrationTester
+
+
+def _polyfit_hurst(series: np.ndarray) -> float:
+    """Reference Hurst slope via np.polyfit (the original implementation)."""
+    lags = range(2, min(100, len(series) // 2))
+    tau = [np.std(np.subtract(series[lag:], series[:-lag])) for lag in lags]
+    return np.polyfit(np.log(lags), np.log(tau), 1)[0]
+
+
+def _series(kind: str, n: int) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    if kind == "random_walk":
+        return rng.normal(size=n).cumsum()
+    if kind == "white_noise":
+        return rng.normal(size=n)
+    if kind == "mean_reverting":
+        x = np.zeros(n)
+        for i in range(1, n):
+            x[i] = 0.8 * x[i - 1] + rng.normal()
+        return x
+    return np.cumsum(rng.normal(loc=0.5, size=n))  # trending
+
+
+@pytest.mark.parametrize("kind", ["random_walk", "white_noise", "mean_reverting", "trending"])
+@pytest.mark.parametrize("n", [8, 60, 500])
+def test_hurst_matches_polyfit(kind, n):
+    series = _series(kind, n)
+
+    hurst = CointegrationTester()._calculate_hurst_exponent(series)
+
+    assert hurst == pytest.approx(_polyfit_hurst(series), rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("n", [0, 3, 5, 6, 7])
+def test_hurst_short_series_is_none(n):
+    # Fewer than two lags: no slope to fit (polyfit raised below 6 points and
+    # returned a rank-deficient one-point fit for 6-7)
+    series = np.random.default_rng(0).normal(size=n)
+
+    assert CointegrationTester()._calculate_hurst_exponent(series) is None
@@ -0,0 +1,82 @@
+"""Tests for configuration loading."""
+
+import json
+import os
+
+import pytest
+
+from src.utils.config import Config
+
+
+@pytest.fixture
+def load_yaml():
+    """Config._load_yaml without the .env/validation work done by __init__."""
+    return Config.__new__(Config)._load_yaml
+
+
+def _cache_path(path):
+    return path.with_name(f".{path.name}.cache.json")
+
+
+def test_cache_written_and_reused(tmp_path, load_yaml):
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1\nb:\n  c: [1, 2]\n")
+
+    assert load_yaml(str(path)) == {'a': 1, 'b': {'c': [1, 2]}}
+    cache = json.loads(_cache_path(path).read_text())
+    assert cache['config'] == {'a': 1, 'b': {'c': [1, 2]}}
+
+    # A matching stamp is trusted, so an edited cache body is what comes back
+    cache['config']['a'] = 2
+    _cache_path(path).write_text(json.dumps(cache))
+    assert load_yaml(str(path))['a'] == 2
+
+
+def test_cache_invalidated_by_size(tmp_path, load_yaml):
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1\n")
+    load_yaml(str(path))
+    stat = path.stat()
+
+    path.write_text("a: 10\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # only the size differs
+
+    assert load_yaml(str(path)) == {'a': 10}
+
+
+def test_cache_invalidated_by_mtime(tmp_path, load_yaml):
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1\n")
+    load_yaml(str(path))
+    stat = path.stat()
+
+    path.write_text("a: 2\n")  # same size
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_yaml(str(path)) == {'a': 2}
+    assert json.loads(_cache_path(path).read_text())['config'] == {'a': 2}
+
+
+@pytest.mark.parametrize("text", ["start: 2024-01-01\n", "1: one\n"])
+def test_values_that_do_not_round_trip_are_not_cached(tmp_path, load_yaml, text):
+    path = tmp_path / "config.yaml"
+    path.write_text(text)
+
+    first = load_yaml(str(path))
+
+    assert not _cache_path(path).exists()
+    assert load_yaml(str(path)) == first
+
+
+def test_corrupt_cache_falls_back_to_yaml(tmp_path, load_yaml):
+    path = tmp_path / "config.yaml"
+    path.write_text("a: 1\n")
+    _cache_path(path).write_text("not json")
+
+    assert load_yaml(str(path)) == {'a': 1}
+    assert json.loads(_cache_path(path).read_text())['config'] == {'a': 1}
+
+
+def test_missing_file_raises(tmp_path, load_yaml):
+    with pytest.raises(FileNotFoundError):
+        load_yaml(str(tmp_path / "missing.yaml"))
@@ -0,0 +1,74 @@
+"""Tests for duplicate-ticket suppression."""
+
+from datetime import datetime
+
+import pytest
+
+from src.runtime.dedup import is_duplicate, load_last_signals, save_last_signals, signal_key
+from src.strategy.state import PositionState, SignalType, TradingSignal
+
+
+def _signal(hour: int, zscore: float = -2.1, signal_type=SignalType.ENTER_LONG_SPREAD) -> TradingSignal:
+    return TradingSignal(
+        timestamp=datetime(2024, 1, 1, hour),
+        signal_type=signal_type,
+        zscore=zscore,
+        beta=0.8,
+        spread=-0.01,
+        reason="",
+        btc_price=42000.0,
+        eth_price=2500.0,
+        previous_state=PositionState.NEUTRAL,
+        new_state=PositionState.LONG_SPREAD,
+    )
+
+
+def test_same_bar_repeat_is_duplicate():
+    last_signals = {"ETH/BTC": signal_key(_signal(12))}
+
+    # Re-run within the hour: same bar, z-score equal at 2 decimals
+    assert is_duplicate(last_signals, "ETH/BTC", _signal(12, zscore=-2.1004))
+
+
+@pytest.mark.parametrize("repeat", [
+    _signal(13),  # new bar
+    _signal(12, zscore=-2.3),  # same bar, different z bucket
+    _signal(12, signal_type=SignalType.ENTER_SHORT_SPREAD),
+])
+def test_changed_signal_is_not_duplicate(repeat):
+    last_signals = {"ETH/BTC": signal_key(_signal(12))}
+
+    assert not is_duplicate(last_signals, "ETH/BTC", repeat)
+
+
+def test_other_pair_is_not_duplicate():
+    last_signals = {"ETH/BTC": signal_key(_signal(12))}
+
+    assert not is_duplicate(last_signals, "SOL/BTC", _signal(12))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / "data" / "last_signals.json"
+    last_signals = {"ETH/BTC": signal_key(_signal(12))}
+
+    save_last_signals(last_signals, path)
+
+    assert load_last_signals(path) == last_signals
+    assert not path.with_suffix(".json.tmp").exists()
+
+
+def test_save_replaces_existing_file(tmp_path):
+    path = tmp_path / "last_signals.json"
+    save_last_signals({"ETH/BTC": "old"}, path)
+    save_last_signals({"ETH/BTC": "new"}, path)
+
+    assert load_last_signals(path) == {"ETH/BTC": "new"}
+
+
+@pytest.mark.parametrize("content", [None, "{not json", "[1, 2]"])
+def test_missing_or_corrupt_file_loads_empty(tmp_path, content):
+    path = tmp_path / "last_signals.json"
+    if content is not None:
+        path.write_text(content)
+
+    assert load_last_signals(path) == {}
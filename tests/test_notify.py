@@ -0,0 +1,41 @@
+"""Tests for notification delivery settings."""
+
+import pytest
+from urllib3.response import HTTPResponse
+
+from src.runtime.notify import MAX_RETRY_AFTER_SEC, NotificationManager
+
+URLS = [
+    "https://hooks.slack.com/services/x",
+    "https://discord.com/api/webhooks/x",
+    "https://api.telegram.org/botX/sendMessage",
+]
+
+
+@pytest.fixture
+def session():
+    session = NotificationManager._build_session()
+    yield session
+    session.close()
+
+
+@pytest.mark.parametrize("url", URLS)
+@pytest.mark.parametrize("header, expected", [
+    ("600", MAX_RETRY_AFTER_SEC),
+    ("2", 2.0),
+])
+def test_retry_after_is_capped_for_every_channel(session, url, header, expected):
+    retry = session.get_adapter(url).max_retries
+    response = HTTPResponse(body=b"", headers={"Retry-After": header}, status=503)
+
+    assert retry.get_retry_after(response) == expected
+    # Copies made between attempts keep the cap
+    assert retry.increment(method="POST", url=url, response=response).get_retry_after(response) == expected
+
+
+def test_telegram_adapter_leaves_429_to_send_telegram(session):
+    telegram = session.get_adapter(URLS[2]).max_retries
+    discord = session.get_adapter(URLS[1]).max_retries
+
+    assert 429 not in telegram.status_forcelist
+    assert 429 in discord.status_forcelist
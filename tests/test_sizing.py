@@ -0,0 +1,102 @@
+"""Tests for volatility-targeting position sizing."""
+
+import copy
+import itertools
+import pickle
+from dataclasses import astuple
+
+import numpy as np
+import pytest
+
+from src.strategy.sizing import PositionSize, VolatilityTargetingSizer
+
+
+@pytest.fixture
+def sizer():
+    return VolatilityTargetingSizer(
+        target_sigma_usd=200.0,
+        max_notional_per_leg=25000.0,
+        max_adv_fraction=0.05,
+        fee_bps=10.0,
+        slippage_bps=5.0,
+        min_notional_per_leg=100.0,
+    )
+
+
+BETAS = [-0.8, 0.0, 0.01, 0.9, 1.3, 40.0]
+# Zero, negative and NaN std must all size to zero; 0.005 hits the per-leg cap
+SPREAD_STDS = [0.0, -0.05, np.nan, 0.005, 0.02, 0.5, 5.0]
+# None disables the ADV limit; 0 and NaN are ignored; small ADV forces a scale-down
+ADVS = [None, 0.0, np.nan, 5e4, 1e6, 1e9]
+
+
+def _assert_rows_match(sizer, batch, cases, capital=None):
+    for row, (beta, spread_std, btc_adv, eth_adv) in zip(batch, cases):
+        expected = sizer.calculate_position_size(
+            beta=beta,
+            spread_std=spread_std,
+            btc_price=30000.0,
+            eth_price=2000.0,
+            btc_adv_usd=btc_adv,
+            eth_adv_usd=eth_adv,
+            capital=capital,
+        )
+        actual = PositionSize.from_record(row)
+        assert astuple(actual) == pytest.approx(astuple(expected), rel=1e-12, abs=1e-9), (
+            beta, spread_std, btc_adv, eth_adv
+        )
+
+
+@pytest.mark.parametrize("capital", [None, 0.0, 50000.0])
+def test_batch_matches_scalar_without_adv(sizer, capital):
+    cases = [(b, s, None, None) for b, s in itertools.product(BETAS, SPREAD_STDS)]
+    beta, spread_std = np.array([c[:2] for c in cases]).T
+
+    batch = sizer.calculate_position_size_batch(
+        beta, spread_std, 30000.0, 2000.0, capital=capital
+    )
+
+    assert batch.shape == (len(cases),)
+    _assert_rows_match(sizer, batch, cases, capital)
+
+
+def test_batch_matches_scalar_with_adv_limits(sizer):
+    advs = [a for a in ADVS if a is not None]
+    cases = list(itertools.product(BETAS, SPREAD_STDS, advs, advs))
+    beta, spread_std, btc_adv, eth_adv = np.array(cases).T
+
+    batch = sizer.calculate_position_size_batch(
+        beta, spread_std, 30000.0, 2000.0, btc_adv_usd=btc_adv, eth_adv_usd=eth_adv
+    )
+
+    _assert_rows_match(sizer, batch, cases)
+
+
+def test_min_notional_cut(sizer):
+    # target 200 / std 1.0 -> 200 USD ETH leg; beta 0.4 -> 80 USD BTC leg (below 100)
+    cases = [(0.4, 1.0, None, None), (0.6, 1.0, None, None), (1.0, 2.5, None, None)]
+    beta, spread_std = np.array([c[:2] for c in cases]).T
+
+    batch = sizer.calculate_position_size_batch(beta, spread_std, 30000.0, 2000.0)
+
+    assert batch['total_notional'].tolist() == [0.0, 320.0, 0.0]
+    _assert_rows_match(sizer, batch, cases)
+
+
+def test_adv_limit_scales_both_legs(sizer):
+    # ETH ADV of 1e5 caps the ETH leg at 5000 USD; BTC keeps the hedge ratio
+    batch = sizer.calculate_position_size_batch(
+        0.5, 0.02, 30000.0, 2000.0, btc_adv_usd=1e9, eth_adv_usd=1e5
+    )
+    pos = PositionSize.from_record(batch)
+
+    assert pos.eth_notional_usd == pytest.approx(5000.0)
+    assert pos.btc_notional_usd == pytest.approx(2500.0)
+
+
+def test_position_size_pickle_and_copy(sizer):
+    pos = sizer.calculate_position_size(0.9, 0.02, 30000.0, 2000.0)
+
+    assert pickle.loads(pickle.dumps(pos)) == pos
+    assert copy.copy(pos) == pos
+    assert copy.deepcopy(pos) == pos
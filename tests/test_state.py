@@ -0,0 +1,223 @@
+"""Tests for the trading state machine."""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategy import state
+from src.strategy.state import PositionState, TradingStateMachine
+
+
+@pytest.fixture(params=["python", "numba"])
+def kernel(request, monkeypatch):
+    """Force process_dataframe_vectorized onto the plain or the JIT kernel."""
+    if request.param == "numba":
+        numba = pytest.importorskip("numba")
+        compiled = numba.jit(nopython=True)(state._run_state_machine)
+        monkeypatch.setattr(state, "_state_kernel", compiled)
+    else:
+        monkeypatch.setattr(state, "_state_kernel", state._run_state_machine)
+    return request.param
+
+
+def _signals_frame(z) -> pd.DataFrame:
+    """Signals DataFrame around a z-score path with deterministic side columns."""
+    z = np.asarray(z, dtype=np.float64)
+    n = len(z)
+    return pd.DataFrame(
+        {
+            "zscore": z,
+            "beta": np.linspace(0.5, 1.5, n),
+            "spread": np.linspace(-10.0, 10.0, n),
+            "btc_price": np.linspace(30000.0, 40000.0, n),
+            "eth_price": np.linspace(2000.0, 3000.0, n),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="h"),
+    )
+
+
+def _random_path(seed: int, n: int = 2000) -> np.ndarray:
+    """Mean-reverting z-score path with NaN gaps and exact threshold hits."""
+    rng = np.random.default_rng(seed)
+    z = np.empty(n)
+    z[0] = 0.0
+    for i in range(1, n):
+        z[i] = 0.9 * z[i - 1] + rng.normal(scale=0.8)
+    z[rng.random(n) < 0.05] = np.nan
+    boundary = rng.choice(n, size=n // 20, replace=False)
+    z[boundary] = rng.choice([-3.5, -2.0, -0.5, 0.5, 2.0, 3.5], size=len(boundary))
+    return z
+
+
+# Hand-written paths hitting each threshold exactly, with NaN ticks in between
+EDGE_PATHS = [
+    # Entries need a strict crossing: sitting on +-z_in does not enter
+    [0.0, 2.0, 2.0, 2.0001, 1.0, 0.5, 0.4999, -2.0, -2.0001, -0.5, -0.4999],
+    # Stop loss is strict too: |z| == z_stop keeps the position
+    [0.0, 2.5, 3.5, -3.5, 3.5001, 0.0, -2.5, -3.5001, 0.0],
+    # NaN ticks are skipped and do not reset the previous z-score
+    [np.nan, 0.0, np.nan, 2.5, np.nan, np.nan, 0.1, np.nan, -1.9, np.nan, -2.1, np.nan],
+    # All-NaN and starting on a threshold
+    [np.nan, np.nan, np.nan],
+    [-2.0, -2.1, 3.6, 2.1, 0.5, 0.49],
+]
+
+
+def _machine_state(sm: TradingStateMachine) -> tuple:
+    return (
+        sm.current_state,
+        sm.entry_zscore,
+        sm.entry_timestamp,
+        sm.entry_beta,
+        sm.previous_zscore,
+    )
+
+
+def _assert_equivalent(df: pd.DataFrame, start_state=None, start_previous=None):
+    scalar = TradingStateMachine()
+    batch = TradingStateMachine()
+    for sm in (scalar, batch):
+        if start_state is not None:
+            sm.current_state = start_state
+        sm.previous_zscore = start_previous
+
+    expected = scalar.process_dataframe(df)
+    actual = batch.process_dataframe_vectorized(df)
+
+    assert actual == expected
+    assert _machine_state(batch) == _machine_state(scalar)
+    return expected
+
+
+@pytest.mark.parametrize("path", EDGE_PATHS)
+def test_vectorized_matches_scalar_on_edge_paths(kernel, path):
+    _assert_equivalent(_signals_frame(path))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_matches_scalar_on_random_paths(kernel, seed):
+    signals = _assert_equivalent(_signals_frame(_random_path(seed)))
+    assert signals  # the path is long enough to trade
+
+
+@pytest.mark.parametrize("start_state", list(PositionState))
+@pytest.mark.parametrize("start_previous", [None, -2.0, 0.0, 2.0])
+def test_vectorized_matches_scalar_from_resumed_state(kernel, start_state, start_previous):
+    _assert_equivalent(_signals_frame(EDGE_PATHS[2]), start_state, start_previous)
+
+
+def test_vectorized_empty_frame_keeps_state(kernel):
+    sm = TradingStateMachine()
+    sm.current_state = PositionState.LONG_SPREAD
+    sm.previous_zscore = -2.5
+
+    assert sm.process_dataframe_vectorized(_signals_frame([])) == []
+    assert sm.current_state == PositionState.LONG_SPREAD
+    assert sm.previous_zscore == -2.5
+
+
+def _tick(sm: TradingStateMachine, hour: int, zscore: float):
+    return sm.process_tick(
+        timestamp=pd.Timestamp("2024-01-01") + pd.Timedelta(hours=hour),
+        zscore=zscore, beta=0.8, spread=-0.01, btc_price=42000.0, eth_price=2500.0
+    )
+
+
+def _saved(path) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def test_signal_writes_state_file(tmp_path):
+    path = tmp_path / "state" / "pair.json"
+    sm = TradingStateMachine(state_file=str(path))
+
+    _tick(sm, 0, 0.0)
+    assert not path.exists()  # no signal, nothing to persist
+
+    _tick(sm, 1, -2.5)
+    saved = _saved(path)
+    assert saved['current_state'] == PositionState.LONG_SPREAD.value
+    assert saved['entry_zscore'] == -2.5
+    assert saved['previous_zscore'] == -2.5
+    assert not path.with_suffix(".json.tmp").exists()
+    assert sm not in state._PENDING_FLUSH
+
+
+def test_persist_interval_defers_writes_until_flush(tmp_path):
+    path = tmp_path / "pair.json"
+    sm = TradingStateMachine(state_file=str(path), persist_interval_sec=3600.0)
+
+    _tick(sm, 0, 0.0)
+    _tick(sm, 1, -2.5)  # first write is never deferred
+    assert _saved(path)['current_state'] == PositionState.LONG_SPREAD.value
+
+    _tick(sm, 2, -0.1)  # exit within the interval: kept in memory only
+    assert sm.current_state == PositionState.NEUTRAL
+    assert _saved(path)['current_state'] == PositionState.LONG_SPREAD.value
+    assert sm in state._PENDING_FLUSH
+
+    sm.flush()  # still inside the interval
+    assert _saved(path)['current_state'] == PositionState.LONG_SPREAD.value
+
+    sm.flush(force=True)
+    assert _saved(path)['current_state'] == PositionState.NEUTRAL.value
+    assert sm not in state._PENDING_FLUSH
+
+
+def test_pending_state_flushed_at_exit(tmp_path):
+    path = tmp_path / "pair.json"
+    sm = TradingStateMachine(state_file=str(path), persist_interval_sec=3600.0)
+    _tick(sm, 0, 0.0)
+    _tick(sm, 1, 2.5)
+    _tick(sm, 2, 0.2)
+    assert _saved(path)['current_state'] == PositionState.SHORT_SPREAD.value
+
+    state._flush_pending_states()
+
+    assert _saved(path)['current_state'] == PositionState.NEUTRAL.value
+
+
+def test_process_dataframe_writes_once(tmp_path, monkeypatch):
+    path = tmp_path / "pair.json"
+    sm = TradingStateMachine(state_file=str(path))
+    writes = []
+    monkeypatch.setattr(state.os, "replace", lambda src, dst: writes.append(dst) or os.rename(src, dst))
+
+    signals = sm.process_dataframe(_signals_frame(_random_path(0)))
+
+    assert len(signals) > 1
+    assert writes == [path]
+
+
+def test_state_reloads_from_file(tmp_path):
+    path = tmp_path / "pair.json"
+    sm = TradingStateMachine(state_file=str(path))
+    _tick(sm, 0, 0.0)
+    _tick(sm, 1, -2.5)
+
+    reloaded = TradingStateMachine(state_file=str(path))
+
+    assert reloaded.current_state == PositionState.LONG_SPREAD
+    assert reloaded.entry_zscore == -2.5
+    assert reloaded.entry_beta == 0.8
+    assert reloaded.entry_timestamp == pd.Timestamp("2024-01-01 01:00")
+    assert reloaded.previous_zscore == -2.5
+    # The reloaded machine continues from the saved state
+    assert _tick(reloaded, 2, 0.1).signal_type.value == "exit_position"
+
+
+def test_reset_persists_neutral_state(tmp_path):
+    path = tmp_path / "pair.json"
+    sm = TradingStateMachine(state_file=str(path), persist_interval_sec=3600.0)
+    _tick(sm, 0, 0.0)
+    _tick(sm, 1, -2.5)
+
+    sm.reset()
+
+    saved = _saved(path)
+    assert saved['current_state'] == PositionState.NEUTRAL.value
+    assert saved['previous_zscore'] is None
@@ -0,0 +1,68 @@
+"""Tests for trade ticket output."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.runtime import tickets
+from src.runtime.tickets import TradeTicketGenerator
+from src.strategy.sizing import PositionSize
+from src.strategy.state import PositionState, SignalType, TradingSignal
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # tickets are written under ./signals
+    return TradeTicketGenerator()
+
+
+@pytest.fixture
+def signal():
+    return TradingSignal(
+        timestamp=datetime(2024, 1, 1, 12),
+        signal_type=SignalType.ENTER_LONG_SPREAD,
+        zscore=np.float64(-2.1),
+        beta=np.float32(0.75),  # not a float subclass, so it goes through the enc_hook
+        spread=np.float64(-0.0123),
+        reason="Z-score crossed below -2.0",
+        btc_price=42000.0,
+        eth_price=2500.0,
+        previous_state=PositionState.NEUTRAL,
+        new_state=PositionState.LONG_SPREAD,
+    )
+
+
+@pytest.fixture
+def position():
+    return PositionSize(10000.0, 7500.0, 4.0, 0.18, 17500.0, 0.0, 17.5, 8.75, 200.0)
+
+
+def test_msgpack_ticket_round_trip(generator, signal, position):
+    msgspec = pytest.importorskip("msgspec")
+
+    path = generator.save_ticket_msgpack(
+        signal, position, "run1", pair_slug="eth_btc", timestamp="20240101_120000_000000"
+    )
+
+    assert path.name == "signal_20240101_120000_000000_run1_eth_btc.msgpack"
+    data = path.read_bytes()
+    length = int.from_bytes(data[:4], "big")
+    assert length == len(data) - 4
+
+    decoded = msgspec.msgpack.decode(data[4:])
+    expected = TradeTicketGenerator._ticket_data(signal, position)
+    expected['beta'] = float(signal.beta)
+    assert decoded == expected
+
+
+def test_msgpack_enc_hook_rejects_unknown_types():
+    with pytest.raises(NotImplementedError):
+        tickets._msgpack_enc_hook(object())
+
+
+def test_msgpack_ticket_requires_msgspec(generator, signal, position, monkeypatch):
+    monkeypatch.setattr(tickets, "_MSGPACK_ENCODER", None)
+
+    with pytest.raises(ImportError):
+        generator.save_ticket_msgpack(signal, position, "run1")